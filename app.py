@@ -1,9 +1,19 @@
+import io
+
 import streamlit as st
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+import matplotlib
+matplotlib.use("Agg")  # headless backend: much faster figure setup than an interactive one
 import matplotlib.pyplot as plt
-from fuzzy_parking_system import ParkingGuidanceSystem
+
+# User type labels, built once instead of on every rerun
+USER_TYPES = {
+    1: "Regular",
+    2: "Member",
+    3: "VIP",
+    4: "Disabled",
+    5: "Staff"
+}
 
 # Page configuration
 st.set_page_config(
@@ -87,27 +97,145 @@ with st.sidebar:
     user_type = st.selectbox(
         "User Type",
         options=[1, 2, 3, 4, 5],
-        format_func=lambda x: {
-            1: "Regular",
-            2: "Member",
-            3: "VIP",
-            4: "Disabled",
-            5: "Staff"
-        }[x],
+        format_func=USER_TYPES.__getitem__,
         help="Select your user type"
     )
     
     # Add calculate button
     calculate_button = st.button("Calculate", type="primary", use_container_width=True)
 
-# Create fuzzy system
-fuzzy_system = ParkingGuidanceSystem()
+# Create fuzzy system once per process; building the scikit-fuzzy control
+# system (universes, membership functions, rule compilation) is pure setup
+# work, so cache it across reruns and sessions instead of rebuilding on
+# every slider move.
+@st.cache_resource
+def get_fuzzy_system():
+    # Imported lazily: this pulls in the whole scipy + scikit-fuzzy import
+    # graph, which should happen behind the spinner on the first Calculate
+    # click rather than during page load.
+    import hashlib
+    import inspect
+    import os
+    import pickle
 
-# Only calculate and show results when button is clicked
-if calculate_button:
+    import fuzzy_parking_system
+    from fuzzy_parking_system import ParkingGuidanceSystem
+
+    # Construction (rule compilation and warm-up) is deterministic, so the
+    # built system is pickled to disk keyed on a hash of the whole module
+    # source (the inference kernel and Definition live at module level, so
+    # hashing just the class would miss changes to them); later cold starts
+    # become a single pickle.load instead of a rebuild.
+    source_hash = hashlib.sha1(
+        inspect.getsource(fuzzy_parking_system).encode()
+    ).hexdigest()
+    cache_path = os.path.join(".cache", f"pgs-{source_hash}.pkl")
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, pickle.PickleError):
+        pass
+
+    system = ParkingGuidanceSystem()
+    # Warm the inference path once at construction time so the lazy setup
+    # inside scikit-fuzzy (rule graph finalization, first defuzzification)
+    # is paid here, behind the cache, rather than on the first user click.
+    system.get_recommendation(50, 12, 0, 50, 1)
+
+    try:
+        os.makedirs(".cache", exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump(system, cache_file)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PickleError):
+        pass
+    return system
+
+# Memoize inference on the input tuple: the sliders only produce small
+# integers, so repeated or re-entered inputs skip the fuzzy computation
+# entirely and return the cached result dict. Inputs are quantized to the
+# integer grid before keying the cache, so near-identical values (e.g. from
+# a future float slider) hit the same cache entry; the membership functions
+# are smooth enough that sub-grid differences do not change the result.
+# Results are persisted to disk, so every input combination ever computed
+# stays an O(1) lookup across process restarts.
+@st.cache_data(max_entries=1024, persist="disk")
+def recommend(traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
+    return get_fuzzy_system().get_recommendation(
+        traffic_density, time_of_day, weather_condition, vacancy_rate, user_type
+    )
+
+
+def recommend_quantized(traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
+    """Quantize inputs to the integer grid, then look up the cached result."""
+    return recommend(
+        int(round(traffic_density)),
+        int(round(time_of_day)),
+        int(round(weather_condition)),
+        int(round(vacancy_rate)),
+        int(user_type),
+    )
+
+
+# Precompute the membership curves once: the universes and membership
+# functions are static, so there is no reason to rebuild the arrays (or
+# walk the fuzzy variables) on every Calculate click.
+@st.cache_data
+def membership_curves(kind):
+    """Return [(universe, stacked_mfs, labels), ...] for 'input' or 'output' variables."""
+    system = get_fuzzy_system()
+    if kind == "input":
+        variables = [system.traffic_density, system.time_of_day,
+                     system.weather_condition, system.vacancy_rate]
+    else:
+        variables = [system.recommended_area, system.waiting_time]
+    curves = []
+    for var in variables:
+        labels = [f"{var.label} - {term}" for term in var.terms]
+        stacked = np.column_stack([var[term].mf for term in var.terms])
+        curves.append((var.universe, stacked, labels))
+    return curves
+
+
+# The membership plots depend only on the (static) fuzzy system, not on
+# the sliders, so render each of them exactly once and cache the PNG
+# bytes; reruns display the image without touching matplotlib at all.
+@st.cache_data
+def membership_png():
+    """Render both membership-function plots once and return PNG bytes."""
+    # One subplots call for both panels: per-Axes setup dominates figure
+    # construction, so sharing a single figure halves it. Rendered for
+    # ~800 px-per-panel web display: a small figure at 72 dpi keeps both
+    # the draw time and the PNG bytes shipped to the browser down, and the
+    # default (non-constrained) layout avoids an extra layout pass.
+    fig, axes = plt.subplots(1, 2, figsize=(16, 3), dpi=72, constrained_layout=False)
+    for ax, kind in zip(axes, ("input", "output")):
+        for universe, stacked, labels in membership_curves(kind):
+            lines = ax.plot(universe, stacked)
+            for line, label in zip(lines, labels):
+                line.set_label(label)
+        ax.legend()
+        ax.set_title(f"{kind.capitalize()} Membership Functions")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=72)
+    plt.close(fig)
+    return buf.getvalue()
+
+# The results panel runs as a fragment: interactions elsewhere on the
+# page rerun their own subtree without re-entering this (comparatively
+# heavy) inference-and-visualization block.
+@st.fragment
+def render_results(traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
     with st.spinner("Calculating recommendations..."):
-        # Get recommendation
-        result = fuzzy_system.get_recommendation(
+        # Force the one-time system construction to happen here, under
+        # the spinner: a disk-cache hit in recommend() below would skip
+        # it, only for a later call (e.g. membership_png) to pay for it
+        # without any progress indication
+        get_fuzzy_system()
+        # Get recommendation (cached on the quantized input tuple)
+        result = recommend_quantized(
             traffic_density, time_of_day, weather_condition, vacancy_rate, user_type
         )
 
@@ -148,44 +276,18 @@ if calculate_button:
                 st.write(f"**Vacancy Rate:** {vacancy_rate}%")
             
             with input_col3:
-                user_type_text = {
-                    1: "Regular",
-                    2: "Member",
-                    3: "VIP",
-                    4: "Disabled",
-                    5: "Staff"
-                }[user_type]
-                st.write(f"**User Type:** {user_type_text}")
+                st.write(f"**User Type:** {USER_TYPES[user_type]}")
 
             # Add visualization section
             st.subheader("System Visualization")
-            viz_col1, viz_col2 = st.columns(2)
-            
-            with viz_col1:
-                st.markdown("### Membership Functions")
-                # Create a figure for membership functions
-                fig1, ax1 = plt.subplots(figsize=(10, 6))
-                fuzzy_system._define_input_membership_functions()
-                fuzzy_system._define_output_membership_functions()
-                # Plot membership functions
-                for var in [fuzzy_system.traffic_density, fuzzy_system.time_of_day, 
-                          fuzzy_system.weather_condition, fuzzy_system.vacancy_rate]:
-                    for term in var.terms:
-                        ax1.plot(var.universe, var[term].mf, label=f"{var.label} - {term}")
-                ax1.legend()
-                ax1.set_title("Input Membership Functions")
-                st.pyplot(fig1)
-            
-            with viz_col2:
-                st.markdown("### Output Membership Functions")
-                # Create a figure for output membership functions
-                fig2, ax2 = plt.subplots(figsize=(10, 6))
-                for var in [fuzzy_system.recommended_area, fuzzy_system.waiting_time]:
-                    for term in var.terms:
-                        ax2.plot(var.universe, var[term].mf, label=f"{var.label} - {term}")
-                ax2.legend()
-                ax2.set_title("Output Membership Functions")
-                st.pyplot(fig2)
+            st.markdown("### Membership Functions")
+            st.image(membership_png())
+
+# Only calculate and show results when button is clicked; the fuzzy system
+# itself is only built (once) on the first click, so plain reruns never pay
+# for it.
+if calculate_button:
+    render_results(traffic_density, time_of_day, weather_condition, vacancy_rate, user_type)
 
 # Add explanation
 with st.expander("How it works"):
